@@ -3,12 +3,13 @@
 # Focus: High-fidelity telemetry, avoiding sampling bias and blocking I/O.
 
 import time
-import csv
 import os
 import random
 import signal
 import sys
 import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
 from mininet.net import Mininet
 from mininet.node import OVSKernelSwitch, Controller
@@ -17,14 +18,14 @@ from mininet.log import setLogLevel
 
 from v2x_env import HybridV2XTopo, MEC_IP
 from utils import (
-    get_interface_stats,
-    get_queue_stats,
-    ping_once,
+    get_host_telemetry,
     start_iperf_servers,
 )
 from traffic_generator import (
     run_traffic_scenario,
     get_traffic_status,
+    kill_flow_agents,
+    node_locks,
     BASE_PORT,
 )
 
@@ -35,6 +36,18 @@ OUTPUT_FILE = "telemetry_dataset.csv"
 DURATION = 120.0          # total experiment time (seconds)
 SAMPLE_INTERVAL = 0.2     # target loop interval (UPDATED from 0.5)
 N_HOSTS = 14
+PING_TIMEOUT = 0.1        # per-host ping timeout (seconds)
+FLUSH_EVERY = 10          # flush the CSV file every N ticks
+WRITE_BUFFER = 1 << 20    # CSV file buffer size (bytes)
+
+# Zone of host h{i} is ZONES[i - 1]; same mapping as infer_zone()
+ZONES = ["highway"] * 4 + ["urban"] * 6 + ["suburb"] * (N_HOSTS - 10)
+
+# One CSV row per host per tick, formatted directly (no csv.writer):
+# timestamp, dt, host, zone, rtt_ms, tx_mbps, rx_mbps,
+# host_queue_depth, host_queue_drops, switch_queue_depth, switch_queue_drops,
+# scenario, is_critical, rtt_loss
+ROW_FMT = "{:.3f},{:.4f},{},{},{},{:.3f},{:.3f},{},{},{},{},{},{},{}\n"
 
 shutdown = False
 
@@ -67,18 +80,38 @@ def infer_zone(host_name):
         return "suburb"
 
 
-def compute_mbps(prev_bytes, now_bytes, dt):
+def compute_rates(prev_tx, tx_bytes, prev_rx, rx_bytes, dt):
     """
-    Convert byte counter delta to Mbps.
+    Convert tx/rx byte counter deltas to Mbps.
+
+    Returns:
+        (tx_mbps, rx_mbps); 0.0 for a direction with no previous sample
+        or a negative delta (counter wrap/reset).
     """
-    if prev_bytes is None or dt <= 0:
-        return 0.0
-    diff = now_bytes - prev_bytes
-    if diff < 0:
-        # counter wrap/reset
-        return 0.0
+    if prev_tx is None or dt <= 0:
+        return 0.0, 0.0
     # bytes -> bits -> Mbps
-    return 8.0 * diff / (dt * 1e6)
+    scale = 8.0 / (dt * 1e6)
+    tx_diff = tx_bytes - prev_tx
+    rx_diff = rx_bytes - prev_rx
+    tx_mbps = tx_diff * scale if tx_diff > 0 else 0.0
+    rx_mbps = rx_diff * scale if rx_diff > 0 else 0.0
+    return tx_mbps, rx_mbps
+
+
+def poll_host(h, intf):
+    """
+    Read one host's raw telemetry for the current tick.
+
+    Runs on a worker thread. Counters, queue stats and the ping go through
+    the host's shell in one round trip, under the traffic generator's node
+    lock so they never overlap its host.cmd() calls.
+
+    Returns:
+        dict from utils.get_host_telemetry().
+    """
+    with node_locks[h.name]:
+        return get_host_telemetry(h, intf, MEC_IP, timeout_sec=PING_TIMEOUT)
 
 
 # ============================================================
@@ -94,6 +127,12 @@ def collect_telemetry(net):
     hosts = [net.get("h{}".format(i)) for i in range(1, N_HOSTS + 1)]
     mec = net.get("mec")
 
+    # 每个 host 不变的信息只算一次: (host, host_name, intf, zone)
+    host_ctx = [
+        (h, h.name, "{}-eth0".format(h.name), ZONES[i - 1])
+        for i, h in enumerate(hosts, 1)
+    ]
+
     # Start iperf servers on MEC
     start_iperf_servers(mec, N_HOSTS, base_port=BASE_PORT)
 
@@ -105,12 +144,13 @@ def collect_telemetry(net):
     # Prepare CSV
     need_header = not os.path.exists(OUTPUT_FILE)
 
-    with open(OUTPUT_FILE, "w", newline="") as f:
-        writer = csv.writer(f)
+    # 每个 host 一个 worker：同一 tick 内并发采集，耗时 ≈ 最慢的那个
+    poll_pool = ThreadPoolExecutor(max_workers=N_HOSTS)
 
+    with poll_pool, open(OUTPUT_FILE, "w", newline="", buffering=WRITE_BUFFER) as f:
         if need_header:
             # === HEADER（已加 rtt_loss）===
-            writer.writerow([
+            f.write(",".join([
                 "timestamp",             # 相对实验起点的时间（秒）
                 "dt",                    # 与上一采样点的时间差
                 "host",
@@ -125,19 +165,26 @@ def collect_telemetry(net):
                 "scenario",
                 "is_critical",
                 "rtt_loss",              # NEW: 0=ok, 1=timeout/failure
-            ])
+            ]) + "\n")
 
-        # 保存上一次的 tx/rx 用来算 Mbps
-        # key: (host_name, intf) -> (tx_bytes, rx_bytes, last_time)
-        prev_bytes = {}
+        # 保存上一次的 tx/rx 用来算 Mbps（按 hosts 顺序索引，None = 还没有采样）
+        # 每个 tick 所有 host 共用同一个 now，所以时间差就是 dt
+        prev_tx_bytes = [None] * len(hosts)
+        prev_rx_bytes = [None] * len(hosts)
 
-        start_time = time.time()
+        # 每个 tick 格式化好的行先攒在这里，tick 结束时一次性 write
+        pending = []
+        tick = 0
+
+        # 用 monotonic 时钟 + 绝对截止时间排期，tick 超时不会累积漂移
+        start_time = time.monotonic()
         last_sample_time = start_time
+        next_tick = start_time + SAMPLE_INTERVAL
 
         print("[*] Start collecting telemetry for {:.1f}s...".format(DURATION))
 
         while not shutdown:
-            now = time.time()
+            now = time.monotonic()
             t_sim = now - start_time
             if t_sim > DURATION:
                 break
@@ -152,36 +199,33 @@ def collect_telemetry(net):
             scenario = status.get("scenario", "idle")
             is_critical = 1 if status.get("is_critical", False) else 0
 
-            for h in hosts:
-                host_name = h.name
-                zone = infer_zone(host_name)
-                intf = "{}-eth0".format(host_name)
+            # 所有 host 并发采集；prev_* 状态只在主线程里更新
+            results = list(poll_pool.map(
+                lambda ctx: poll_host(ctx[0], ctx[2]), host_ctx
+            ))
+
+            for i, (h, host_name, intf, zone) in enumerate(host_ctx):
+                r = results[i]
+                tx_bytes = r["tx_bytes"]
+                rx_bytes = r["rx_bytes"]
+                host_q_depth = r["queue_depth"]
+                host_q_drops = r["queue_drops"]
+                rtt_ms = r["rtt_ms"]
+                rtt_loss = r["rtt_loss"]
 
                 # ------------------------------
                 # 1) Interface stats -> Mbps
                 # ------------------------------
-                tx_bytes, rx_bytes, _tx_dropped = get_interface_stats(h, intf)
-
-                key = (host_name, intf)
-                prev = prev_bytes.get(key)
-
-                if prev:
-                    prev_tx, prev_rx, prev_t = prev
-                    dt_bytes = now - prev_t
-                else:
-                    prev_tx = prev_rx = None
-                    dt_bytes = dt
-
-                tx_mbps = compute_mbps(prev_tx, tx_bytes, dt_bytes)
-                rx_mbps = compute_mbps(prev_rx, rx_bytes, dt_bytes)
+                tx_mbps, rx_mbps = compute_rates(
+                    prev_tx_bytes[i], tx_bytes, prev_rx_bytes[i], rx_bytes, dt
+                )
 
-                prev_bytes[key] = (tx_bytes, rx_bytes, now)
+                prev_tx_bytes[i] = tx_bytes
+                prev_rx_bytes[i] = rx_bytes
 
                 # ------------------------------
                 # 2) Queue stats
                 # ------------------------------
-                host_q_depth, host_q_drops = get_queue_stats(h, intf)
-
                 # 如果你有明确的“核心交换机/瓶颈端口”，可以在这里改成从 switch 上取
                 switch_q_depth = 0
                 switch_q_drops = 0
@@ -189,9 +233,6 @@ def collect_telemetry(net):
                 # ------------------------------
                 # 3) RTT + loss
                 # ------------------------------
-                # 使用新的 utils.ping_once：返回 (rtt_ms, rtt_loss)
-                rtt_ms, rtt_loss = ping_once(h, MEC_IP, timeout_sec=0.1)
-
                 # 去掉 1000.0 魔法数，统一用 NaN 表示“测不到”
                 if rtt_ms is None:
                     rtt_ms = float("nan")
@@ -199,14 +240,14 @@ def collect_telemetry(net):
                 # ------------------------------
                 # 4) 写 CSV（最后一列是 rtt_loss）
                 # ------------------------------
-                writer.writerow([
-                    round(t_sim, 3),          # timestamp
-                    round(dt, 4),             # dt
+                pending.append(ROW_FMT.format(
+                    t_sim,                    # timestamp
+                    dt,                       # dt
                     host_name,
                     zone,
                     rtt_ms,
-                    round(tx_mbps, 3),
-                    round(rx_mbps, 3),
+                    tx_mbps,
+                    rx_mbps,
                     host_q_depth,
                     host_q_drops,
                     switch_q_depth,
@@ -214,13 +255,23 @@ def collect_telemetry(net):
                     scenario,
                     is_critical,
                     int(rtt_loss),
-                ])
+                ))
+
+            f.write("".join(pending))
+            pending.clear()
+
+            tick += 1
+            if tick % FLUSH_EVERY == 0:
+                f.flush()
 
-            # 控制采样周期（尽量贴近 SAMPLE_INTERVAL）
-            loop_end = time.time()
-            sleep_time = SAMPLE_INTERVAL - (loop_end - now)
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+            # 控制采样周期：睡到下一个绝对截止时间
+            slack = next_tick - time.monotonic()
+            if slack > 0:
+                time.sleep(slack)
+            elif slack < -SAMPLE_INTERVAL:
+                # 落后超过一个周期：重新对齐，不连续补采
+                next_tick = time.monotonic()
+            next_tick += SAMPLE_INTERVAL
 
         print("[*] Telemetry collection finished.")
 
@@ -246,7 +297,19 @@ def main():
         collect_telemetry(net)
     finally:
         print("[*] Stopping Mininet...")
+        # iperf3 -D 服务端、后台 client 和 flow agent 不会随 net.stop() 退出；
+        # flow agent 按 PID 结束，pkill 和 net.stop() 并行跑，不额外阻塞关停
+        kill_flow_agents()
+        killer = subprocess.Popen(
+            ["pkill", "-9", "iperf3"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
         net.stop()
+        try:
+            killer.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            killer.kill()
 
 
 if __name__ == "__main__":
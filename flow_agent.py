@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# flow_agent.py - Per-host flow launcher for the V2X traffic generator
+#
+# Started once inside each Mininet host's namespace by traffic_generator.py.
+# Reads flow requests from a control FIFO, one per line:
+#       <port> <bandwidth_mbps> <duration_sec> [<flow_id>]
+# and sends each flow itself as paced UDP, so starting a flow costs the
+# generator one FIFO write instead of a node.cmd() round trip. When a flow
+# with an id ends, "<flow_id>\n" is written to the done FIFO (--done), so
+# the generator can wait for real flow ends instead of worst-case sleeps.
+#
+# The sender is a plain sendto() loop paced on time.monotonic(), which
+# keeps the requested rate smooth; iperf3's UDP client stalls on select()
+# every few writes and emits bursts instead.
+
+import argparse
+import os
+import socket
+import threading
+import time
+
+PAYLOAD_SIZE = 1400      # UDP payload bytes (fits a 1500-byte MTU)
+PACING_TICK = 0.001      # seconds between pacing checks
+SNDBUF_BYTES = 4 << 20   # large send buffer so pacing, not the socket, sets the rate
+
+
+class FlowLog:
+    """
+    One append-only log per agent, opened once and shared by all flows.
+    """
+
+    def __init__(self, path):
+        self._f = open(path, "a", buffering=1)
+        self._lock = threading.Lock()
+
+    def write(self, line):
+        with self._lock:
+            self._f.write(line)
+
+
+def blast(server_ip, port, bandwidth_mbps, duration_sec, log=None):
+    """
+    Send a constant-rate UDP flow to server_ip:port for duration_sec.
+
+    Each pacing tick sends however many packets are due by now, so the
+    average rate stays on target even when a sleep overshoots. A summary
+    line goes to 'log' (a FlowLog) if given.
+    """
+    pps = bandwidth_mbps * 1e6 / 8.0 / PAYLOAD_SIZE
+    payload = bytes(PAYLOAD_SIZE)
+    dest = (server_ip, port)
+    sent = 0
+    errors = 0
+
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SNDBUF_BYTES)
+
+        started_at = time.time()  # wall clock, for the log only
+        start = time.monotonic()
+        end = start + duration_sec
+        now = start
+        while now < end:
+            due = int((now - start) * pps)
+            while sent < due:
+                try:
+                    sock.sendto(payload, dest)
+                except OSError:
+                    # e.g. ENOBUFS: count it and keep the schedule
+                    errors += 1
+                sent += 1
+            time.sleep(PACING_TICK)
+            now = time.monotonic()
+
+    if log is not None:
+        log.write(
+            "{:.3f} udp {}:{} {:.1f} Mbps {:.1f}s: {} packets, {} send errors\n".format(
+                started_at, server_ip, port, bandwidth_mbps, duration_sec, sent, errors
+            )
+        )
+
+
+def run_flow(server_ip, port, bandwidth_mbps, duration_sec, log=None,
+             flow_id=None, done_fd=None):
+    """
+    Send one flow with blast(), then report flow_id on done_fd if both are set.
+    """
+    try:
+        blast(server_ip, port, bandwidth_mbps, duration_sec, log)
+    finally:
+        if flow_id is not None and done_fd is not None:
+            try:
+                # Short line, well below PIPE_BUF: atomic across sender threads
+                os.write(done_fd, "{}\n".format(flow_id).encode())
+            except OSError:
+                pass
+
+
+def launch_flow(server_ip, port, bandwidth_mbps, duration_sec, log=None,
+                flow_id=None, done_fd=None):
+    """
+    Start one UDP flow towards server_ip:port on a background thread.
+
+    Returns:
+        threading.Thread running the flow.
+    """
+    t = threading.Thread(
+        target=run_flow,
+        args=(server_ip, port, bandwidth_mbps, duration_sec, log, flow_id, done_fd),
+    )
+    t.daemon = True
+    t.start()
+    return t
+
+
+def serve(ctl_path, server_ip, log=None, done_path=None):
+    """
+    Read flow requests from the control FIFO forever.
+
+    The FIFO is opened read-write so the agent itself always counts as a
+    writer: reads block between requests instead of hitting EOF whenever
+    the generator closes its end. The done FIFO is opened read-write for
+    the same reason, so opening it never blocks or fails on a missing reader.
+    """
+    done_fd = os.open(done_path, os.O_RDWR) if done_path else None
+
+    fd = os.open(ctl_path, os.O_RDWR)
+    with os.fdopen(fd, "r") as ctl:
+        for line in ctl:
+            parts = line.split()
+            if len(parts) not in (3, 4):
+                continue
+
+            try:
+                port = int(parts[0])
+                bw = float(parts[1])
+                dur = float(parts[2])
+                flow_id = int(parts[3]) if len(parts) == 4 else None
+            except ValueError:
+                continue
+
+            launch_flow(server_ip, port, bw, dur, log, flow_id, done_fd)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="V2X per-host flow agent")
+    parser.add_argument("--ctl", required=True, help="control FIFO path")
+    parser.add_argument("--server-ip", required=True, help="flow destination IP")
+    parser.add_argument("--cpu", type=int, default=None, help="pin agent to this CPU")
+    parser.add_argument("--log", default=None, help="append flow summaries here")
+    parser.add_argument("--done", default=None, help="FIFO for flow-end reports")
+    args = parser.parse_args()
+
+    if args.cpu is not None:
+        # Before any sender thread starts, so they all inherit the affinity
+        try:
+            os.sched_setaffinity(0, {args.cpu})
+        except (AttributeError, OSError):
+            pass
+
+    log = FlowLog(args.log) if args.log else None
+    serve(args.ctl, args.server_ip, log, args.done)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,16 +10,40 @@
 #     so that each run produces different traffic while preserving the pattern.
 #   - One host -> one iperf3 server port: BASE_PORT + host_index
 #   - Node-level locks to avoid concurrent node.cmd() calls.
+#   - Flows are started through a per-host flow agent (flow_agent.py) fed
+#     by a control FIFO; node.cmd() is only the fallback.
+#   - Agents report finished flows on a done FIFO, so scenarios wait for
+#     the flows they started rather than for their worst-case duration.
 
+import os
+import sys
 import time
 import random
+import selectors
+import signal
 import threading
 import traceback
-import re
+from itertools import accumulate, count
+from types import MappingProxyType
 
 from v2x_env import MEC_IP  # Keep MEC IP consistent with topology
 
 BASE_PORT = 5000  # server ports: 5001..50014 for h1..h14
+N_HOSTS = 14
+
+FLOW_AGENT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "flow_agent.py")
+FLOW_CTL_PATH = "/tmp/v2x_flow_{}.fifo"  # per-host control FIFO
+FLOW_LOG_PATH = "/tmp/v2x_flow_{}.log"   # per-host agent log (LOG_IPERF=1)
+FLOW_DONE_PATH = "/tmp/v2x_flow_{}.done"  # per-host flow-end reports
+FLOW_DRAIN_SEC = 1.0  # after the last flow ends, let queued packets drain
+AGENT_START_TIMEOUT = 5.0  # seconds to wait for agents to open their FIFOs
+
+# Per-flow logging is off unless LOG_IPERF=1 is set in the environment
+LOG_FLOWS = os.environ.get("LOG_IPERF") == "1"
+
+# CPU for the generator thread; flow agents are spread over the other CPUs.
+# None disables pinning.
+TG_CPU = 0
 
 # =============== Global traffic status ===============
 traffic_status = {
@@ -30,70 +54,263 @@ traffic_status = {
 }
 status_lock = threading.Lock()
 
-# Node-level locks to protect node.cmd()
-node_locks = {}
-node_locks_init = threading.Lock()
 
+# Read-only copy of traffic_status, replaced (never mutated) on every update.
+# Readers take it without locking; rebinding a global is atomic in CPython.
+_status_snapshot = MappingProxyType(dict(traffic_status))
 
-def get_node_lock(node_name):
-    """Get or create a lock for a specific Mininet node."""
-    with node_locks_init:
-        if node_name not in node_locks:
-            node_locks[node_name] = threading.Lock()
-        return node_locks[node_name]
+# Node-level locks to protect node.cmd(); fixed set, created once at import
+# so lookups never need a lock of their own. Shared with collect_data.py.
+node_locks = {
+    "h{}".format(i): threading.Lock() for i in range(1, N_HOSTS + 1)
+}
+
+# Ids tagged onto agent flow requests; the agent echoes them when flows end
+_flow_ids = count(1)
+
+# PIDs of the flow agents started by start_flow_agents(). Mininet hosts
+# share the root PID namespace, so these can be signalled from here.
+_agent_pids = []
 
 
 def get_traffic_status():
-    """Thread-safe getter for traffic_status."""
+    """Lock-free getter: the latest read-only snapshot of traffic_status."""
+    return _status_snapshot
+
+
+def _set_status(**fields):
+    """Update traffic_status and publish a new snapshot (single writer)."""
+    global _status_snapshot
     with status_lock:
-        return traffic_status.copy()
+        traffic_status.update(fields)
+        _status_snapshot = MappingProxyType(dict(traffic_status))
 
 
 def update_status(scenario, nodes):
     """Thread-safe update of current scenario and active nodes."""
-    with status_lock:
-        traffic_status["current_scenario"] = scenario
-        traffic_status["active_nodes"] = list(nodes) if nodes else []
+    _set_status(
+        current_scenario=scenario,
+        active_nodes=list(nodes) if nodes else [],
+    )
 
 
-def _host_index_from_name(name):
+def build_host_table(host_entries):
     """
-    Extract integer index from a host name like 'h6' -> 6.
-    Returns None if parsing fails.
+    Build the per-host dispatch table once, after host validation.
+
+    Args:
+        host_entries: list of (name, index, host) for the hosts found in
+            the network, e.g. ('h6', 6, <Host h6>).
+
+    Returns:
+        dict name -> (name, index, host, port, lock); the tuple is what
+        start_iperf_flow() takes.
     """
-    try:
-        m = re.match(r"h(\d+)$", name)
-        if not m:
-            return None
-        return int(m.group(1))
-    except Exception:
+    return {
+        name: (name, idx, host, BASE_PORT + idx, node_locks[name])
+        for name, idx, host in host_entries
+    }
+
+
+def _agent_cpus():
+    """CPUs available to flow agents, or None if pinning is off."""
+    if TG_CPU is None or not hasattr(os, "sched_setaffinity"):
         return None
+    # Main thread's mask: this thread may already be pinned to TG_CPU
+    cpus = sorted(os.sched_getaffinity(os.getpid()) - {TG_CPU})
+    return cpus or None
+
+
+def _pin_current_thread(cpu):
+    """Pin the calling thread to one CPU; silently skipped if unsupported."""
+    try:
+        # pid 0 is the calling thread on Linux
+        os.sched_setaffinity(0, {cpu})
+    except (AttributeError, OSError):
+        pass
+
+
+def start_flow_agents(host_table):
+    """
+    Start one flow agent per host, each reading its own control FIFO.
+
+    The FIFOs live in /tmp, which Mininet hosts share with the root
+    namespace, so the generator can feed them without entering the host.
+
+    Agents are pinned round-robin to the CPUs not used by the generator
+    thread (see TG_CPU). Returns once every agent reads its control FIFO,
+    or after AGENT_START_TIMEOUT with a warning, so the first flows of a
+    run go through the agents like all later ones.
+
+    Args:
+        host_table: dict from build_host_table().
+
+    Returns:
+        list of read fds, one per host done FIFO, for wait_for_flows().
+        The caller closes them.
+    """
+    cpus = _agent_cpus()
+    done_fds = []
+
+    for k, (name, _idx, host, _port, lock) in enumerate(host_table.values()):
+        ctl = FLOW_CTL_PATH.format(name)
+        done = FLOW_DONE_PATH.format(name)
+        for path in (ctl, done):
+            if os.path.exists(path):
+                os.remove(path)
+            os.mkfifo(path)
+
+        # Read-write, so the FIFO never reports EOF while no agent holds it
+        done_fds.append(os.open(done, os.O_RDWR | os.O_NONBLOCK))
+
+        opts = " --done {}".format(done)
+        if cpus:
+            opts += " --cpu {}".format(cpus[k % len(cpus)])
+        if LOG_FLOWS:
+            opts += " --log {}".format(FLOW_LOG_PATH.format(name))
+
+        cmd = (
+            "{py} {agent} --ctl {ctl} --server-ip {ip}{opts} >/dev/null 2>&1 & "
+            "echo $!"
+        ).format(py=sys.executable, agent=FLOW_AGENT, ctl=ctl, ip=MEC_IP, opts=opts)
+        with lock:
+            out = host.cmd(cmd)
+
+        try:
+            # Last token: any job-control notice comes before echo's output
+            _agent_pids.append(int(out.split()[-1]))
+        except (IndexError, ValueError):
+            print("   [WARN] no PID for the flow agent on {}".format(name))
+
+    waiting = list(host_table)
+    deadline = time.monotonic() + AGENT_START_TIMEOUT
+    while waiting and time.monotonic() < deadline:
+        time.sleep(0.05)
+        waiting = [name for name in waiting if not _agent_reading(name)]
+    if waiting:
+        print("   [WARN] flow agents not ready on {}".format(waiting))
+
+    return done_fds
+
+
+def _agent_reading(node_name):
+    """True if an agent has the host's control FIFO open for reading."""
+    try:
+        # O_NONBLOCK: fails with ENXIO while nobody reads
+        fd = os.open(FLOW_CTL_PATH.format(node_name), os.O_WRONLY | os.O_NONBLOCK)
+    except OSError:
+        return False
+    os.close(fd)
+    return True
+
+
+def kill_flow_agents():
+    """
+    Terminate the flow agents started by start_flow_agents().
+
+    Safe to call more than once and from several threads: each PID is
+    taken off the list before it is signalled.
+    """
+    while _agent_pids:
+        try:
+            pid = _agent_pids.pop()
+        except IndexError:
+            break
+        try:
+            os.kill(pid, signal.SIGTERM)
+        except OSError:
+            pass
+
+
+def stop_flow_agents(host_table, done_fds):
+    """
+    Stop the flow agents, close the done FIFO fds and remove both FIFOs
+    of every host.
+    """
+    kill_flow_agents()
+
+    for fd in done_fds:
+        os.close(fd)
+
+    for name in host_table:
+        for path in (FLOW_CTL_PATH.format(name), FLOW_DONE_PATH.format(name)):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def _send_to_agent(node_name, port, bandwidth_mbps, duration_sec, flow_id):
+    """
+    Hand one flow request to the host's flow agent.
+
+    Returns:
+        True if the request was written, False if no agent is reading the
+        FIFO (not started yet, or exited).
+    """
+    line = "{} {:.3f} {:.3f} {}\n".format(port, bandwidth_mbps, duration_sec, flow_id)
+    try:
+        # O_NONBLOCK: fail with ENXIO instead of blocking if nobody reads
+        fd = os.open(FLOW_CTL_PATH.format(node_name), os.O_WRONLY | os.O_NONBLOCK)
+    except OSError:
+        return False
+
+    try:
+        # Lines are far below PIPE_BUF, so each write is atomic
+        os.write(fd, line.encode())
+        return True
+    except OSError:
+        return False
+    finally:
+        os.close(fd)
 
 
-def start_iperf_flow(host, bandwidth_mbps, duration_sec, log_suffix=""):
+def start_iperf_flow(entry, bandwidth_mbps, duration_sec, log_suffix=""):
     """
-    Start an iperf3 UDP flow from 'host' to MEC with node-level locking.
+    Start an iperf3 UDP flow from the host in 'entry' to MEC.
+
+    The flow is handed to the host's flow agent when one is running;
+    otherwise iperf3 is started through host.cmd() with node-level locking.
+
+    Args:
+        entry: (name, index, host, port, lock) tuple from build_host_table().
+
+    Returns:
+        True if the flow was started, False on failure.
 
     Requirements:
       - MEC node must be running iperf3 servers:
             BASE_PORT + i   for host hi
         Example: h1 -> 5001, h2 -> 5002, ..., h14 -> 5014.
     """
-    if host is None:
-        return False
+    started, _flow_id = _start_flow(entry, bandwidth_mbps, duration_sec, log_suffix)
+    return started
 
-    node_name = host.name
-    idx = _host_index_from_name(node_name)
-    if idx is None:
-        print("   [WARN] Unknown host name format: {}".format(node_name))
-        return False
 
-    port = BASE_PORT + idx
-    lock = get_node_lock(node_name)
+def _start_flow(entry, bandwidth_mbps, duration_sec, log_suffix=""):
+    """
+    start_iperf_flow() for callers that wait on the flow's end.
+
+    Returns:
+        (started, flow_id): flow_id is set only when an agent took the flow
+        (it reports the id on its done FIFO when the flow ends) and is None
+        for the iperf3 fallback, which sends no report. See wait_for_flows().
+    """
+    node_name, _idx, host, port, lock = entry
+
+    flow_id = next(_flow_ids)
+    if _send_to_agent(node_name, port, bandwidth_mbps, duration_sec, flow_id):
+        return True, flow_id
+
+    print("   [WARN] no flow agent on {}, starting iperf3 instead".format(node_name))
+
+    if LOG_FLOWS:
+        log_file = "/tmp/iperf_{}{}_{}.log".format(node_name, log_suffix, port)
+    else:
+        log_file = "/dev/null"
 
     lock.acquire()
     try:
-        log_file = "/tmp/iperf_{}{}_{}.log".format(node_name, log_suffix, port)
         cmd = (
             "iperf3 -c {ip} -p {port} -u -b {bw}M -t {dur} "
             "> {log} 2>&1 &"
@@ -105,14 +322,92 @@ def start_iperf_flow(host, bandwidth_mbps, duration_sec, log_suffix=""):
             log=log_file,
         )
         host.cmd(cmd)
-        return True
+        return True, None
     except Exception as e:
         print("   [ERROR] iperf on {}: {}".format(node_name, e))
-        return False
+        return False, None
     finally:
         lock.release()
 
 
+def uniform_batch(low, high, n):
+    """Draw n independent samples from U(low, high) as a list."""
+    uniform = random.uniform
+    return [uniform(low, high) for _ in range(n)]
+
+
+def build_schedule(gaps):
+    """
+    Turn inter-start gaps into start offsets from the scenario start.
+
+    Returns:
+        (starts, span): starts[i] = sum(gaps[:i]), and span = sum(gaps),
+        i.e. when the gap after the last flow ends.
+    """
+    offsets = [0.0]
+    offsets.extend(accumulate(gaps))
+    return offsets[:-1], offsets[-1]
+
+
+def sleep_until(deadline):
+    """Sleep until the given time.monotonic() deadline (no-op if past)."""
+    remaining = deadline - time.monotonic()
+    if remaining > 0:
+        time.sleep(remaining)
+
+
+def wait_for_flows(done_fds, flows, deadline):
+    """
+    Block until every flow in 'flows' has ended, or until 'deadline'.
+
+    Once the last flow reports, wait FLOW_DRAIN_SEC more (never past
+    'deadline') so its queued packets don't spill into the next scenario.
+
+    Args:
+        done_fds: fds from start_flow_agents().
+        flows: (started, flow_id) results of _start_flow(). Flows
+            that did not start are ignored; a started flow without an id
+            sends no end report, so the wait runs to the full deadline.
+        deadline: time.monotonic() upper bound on the wait.
+    """
+    started = [flow_id for ok, flow_id in flows if ok]
+    if None in started:
+        sleep_until(deadline)
+        return
+
+    pending = set(started)
+    if not pending:
+        return
+
+    with selectors.DefaultSelector() as sel:
+        for fd in done_fds:
+            sel.register(fd, selectors.EVENT_READ)
+
+        partial = {}  # fd -> bytes of an incomplete trailing line
+        while pending:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                return
+
+            for key, _ in sel.select(timeout):
+                try:
+                    data = partial.pop(key.fd, b"") + os.read(key.fd, 4096)
+                except BlockingIOError:
+                    continue
+
+                *lines, rest = data.split(b"\n")
+                if rest:
+                    partial[key.fd] = rest
+                for line in lines:
+                    # Ids from earlier scenarios are simply not pending
+                    try:
+                        pending.discard(int(line))
+                    except ValueError:
+                        pass
+
+    sleep_until(min(time.monotonic() + FLOW_DRAIN_SEC, deadline))
+
+
 def safe_get_host(net, name):
     """Safely get a host from the Mininet network."""
     try:
@@ -173,6 +468,9 @@ def run_traffic_scenario(net, duration_limit=None):
     """
     global traffic_status
 
+    if TG_CPU is not None:
+        _pin_current_thread(TG_CPU)
+
     print(">>> [Traffic Gen] Starting. Waiting 3s for network stability...")
     time.sleep(3.0)
 
@@ -182,28 +480,30 @@ def run_traffic_scenario(net, duration_limit=None):
 
     # Cache all hosts
     print(">>> [Traffic Gen] Validating hosts...")
-    valid_hosts = {}
-    for i in range(1, 15):
+    host_entries = []
+    for i in range(1, N_HOSTS + 1):
         name = "h{}".format(i)
         h = safe_get_host(net, name)
         if h is not None:
-            valid_hosts[name] = h
-            get_node_lock(name)  # pre-create lock
+            host_entries.append((name, i, h))
             print("   -> {} OK".format(name))
 
-    with status_lock:
-        traffic_status["running"] = True
+    host_table = build_host_table(host_entries)
+
+    print(">>> [Traffic Gen] Starting flow agents...")
+    done_fds = start_flow_agents(host_table)
 
-    start_time = time.time()
+    _set_status(running=True)
+
+    start_time = time.monotonic()
     cycle = 0
 
     try:
         while True:
             cycle += 1
-            with status_lock:
-                traffic_status["cycle_count"] = cycle
+            _set_status(cycle_count=cycle)
 
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             if duration_limit is not None and elapsed > duration_limit:
                 print(">>> [Traffic Gen] Duration limit reached.")
                 break
@@ -214,19 +514,27 @@ def run_traffic_scenario(net, duration_limit=None):
             print("\n>>> [Cycle {}] Scenario A: Highway Chain (randomized)".format(cycle))
             active = []
 
-            for node_name in HW_NODES:
-                elapsed = time.time() - start_time
+            # Draw all flow parameters for this scenario up front
+            n = len(HW_NODES)
+            bws = uniform_batch(HW_BW_MIN, HW_BW_MAX, n)
+            durs = uniform_batch(HW_DUR_MIN, HW_DUR_MAX, n)
+            gaps = uniform_batch(HW_GAP_MIN, HW_GAP_MAX, n)
+            starts, span = build_schedule(gaps)
+
+            # Flow starts are paced against absolute deadlines so time spent
+            # dispatching a flow doesn't stretch the following gaps
+            scenario_start = time.monotonic()
+            for node_name, bw, dur, gap, start in zip(HW_NODES, bws, durs, gaps, starts):
+                sleep_until(scenario_start + start)
+
+                elapsed = time.monotonic() - start_time
                 if duration_limit is not None and elapsed > duration_limit:
                     break
 
-                host = valid_hosts.get(node_name)
-                if host is None:
+                entry = host_table.get(node_name)
+                if entry is None:
                     continue
 
-                bw = random.uniform(HW_BW_MIN, HW_BW_MAX)
-                dur = random.uniform(HW_DUR_MIN, HW_DUR_MAX)
-                gap = random.uniform(HW_GAP_MIN, HW_GAP_MAX)
-
                 active.append(node_name)
                 update_status("A-Highway", active)
 
@@ -235,10 +543,10 @@ def run_traffic_scenario(net, duration_limit=None):
                         node_name, bw, dur, gap
                     )
                 )
-                start_iperf_flow(host, bw, dur, "_hw")
-
-                # Inter-flow gap (allows partial overlap)
-                time.sleep(gap)
+                start_iperf_flow(entry, bw, dur, "_hw")
+            else:
+                # Inter-flow gap after the last flow (allows partial overlap)
+                sleep_until(scenario_start + span)
 
             print("   -> Highway scenario complete.")
             update_status("A-Highway-done", [])
@@ -247,7 +555,7 @@ def run_traffic_scenario(net, duration_limit=None):
             # ==========================================
             # Scenario B: Urban burst + diffusion
             # ==========================================
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             if duration_limit is not None and elapsed > duration_limit:
                 break
 
@@ -259,10 +567,12 @@ def run_traffic_scenario(net, duration_limit=None):
 
             active = []
             max_dur = 0.0
+            flows = []
+            scenario_start = time.monotonic()
 
             # 1) Center burst at h6
-            center_host = valid_hosts.get(URBAN_CENTER)
-            if center_host is not None:
+            center_entry = host_table.get(URBAN_CENTER)
+            if center_entry is not None:
                 c_bw = random.uniform(URB_CENTER_BW_MIN, URB_CENTER_BW_MAX)
                 c_dur = random.uniform(URB_CENTER_DUR_MIN, URB_CENTER_DUR_MAX)
                 max_dur = max(max_dur, c_dur)
@@ -275,26 +585,27 @@ def run_traffic_scenario(net, duration_limit=None):
                         URBAN_CENTER, c_bw, c_dur
                     )
                 )
-                start_iperf_flow(center_host, c_bw, c_dur, "_urb_c")
+                flows.append(_start_flow(center_entry, c_bw, c_dur, "_urb_c"))
 
             # Small delay before diffusion starts
             delay = random.uniform(URB_DIFFUSE_DELAY_MIN, URB_DIFFUSE_DELAY_MAX)
-            time.sleep(delay)
+            sleep_until(scenario_start + delay)
 
             # 2) Random subset of neighbors start sending
-            neighbor_candidates = [n for n in URBAN_NEIGHBORS if n in valid_hosts]
+            neighbor_candidates = [n for n in URBAN_NEIGHBORS if n in host_table]
             if len(neighbor_candidates) > 0:
                 k = random.randint(1, len(neighbor_candidates))
                 targets = random.sample(neighbor_candidates, k)
                 print("   -> Diffusion to neighbors: {}".format(targets))
 
-                for name in targets:
-                    host = valid_hosts.get(name)
-                    if host is None:
+                bws = uniform_batch(URB_NEI_BW_MIN, URB_NEI_BW_MAX, k)
+                durs = uniform_batch(URB_NEI_DUR_MIN, URB_NEI_DUR_MAX, k)
+
+                for name, b, d in zip(targets, bws, durs):
+                    entry = host_table.get(name)
+                    if entry is None:
                         continue
 
-                    b = random.uniform(URB_NEI_BW_MIN, URB_NEI_BW_MAX)
-                    d = random.uniform(URB_NEI_DUR_MIN, URB_NEI_DUR_MAX)
                     max_dur = max(max_dur, d)
 
                     active.append(name)
@@ -305,11 +616,13 @@ def run_traffic_scenario(net, duration_limit=None):
                             name, b, d
                         )
                     )
-                    start_iperf_flow(host, b, d, "_urb_n")
+                    flows.append(_start_flow(entry, b, d, "_urb_n"))
 
-            # Wait until most Urban flows are done
+            # Wait until the Urban flows are done (at most the old worst case)
             if max_dur > 0:
-                time.sleep(max_dur + 1.0)
+                wait_for_flows(
+                    done_fds, flows, scenario_start + delay + max_dur + 1.0
+                )
 
             print("   -> Urban scenario complete.")
             update_status("B-Urban-done", [])
@@ -318,7 +631,7 @@ def run_traffic_scenario(net, duration_limit=None):
             # ==========================================
             # Scenario C: Suburb low-load random
             # ==========================================
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             if duration_limit is not None and elapsed > duration_limit:
                 break
 
@@ -328,7 +641,7 @@ def run_traffic_scenario(net, duration_limit=None):
                 )
             )
 
-            suburb_hosts = [n for n in SUBURB_NODES if n in valid_hosts]
+            suburb_hosts = [n for n in SUBURB_NODES if n in host_table]
             if len(suburb_hosts) > 0:
                 # Randomly pick 1–3 suburban hosts
                 k = random.randint(1, min(3, len(suburb_hosts)))
@@ -338,14 +651,17 @@ def run_traffic_scenario(net, duration_limit=None):
 
                 print("   -> Suburb targets: {}".format(targets))
 
+                bws = uniform_batch(SUB_BW_MIN, SUB_BW_MAX, k)
+                durs = uniform_batch(SUB_DUR_MIN, SUB_DUR_MAX, k)
+
                 max_dur_sub = 0.0
-                for name in targets:
-                    host = valid_hosts.get(name)
-                    if host is None:
+                flows = []
+                scenario_start = time.monotonic()
+                for name, bw, dur in zip(targets, bws, durs):
+                    entry = host_table.get(name)
+                    if entry is None:
                         continue
 
-                    bw = random.uniform(SUB_BW_MIN, SUB_BW_MAX)
-                    dur = random.uniform(SUB_DUR_MIN, SUB_DUR_MAX)
                     max_dur_sub = max(max_dur_sub, dur)
 
                     print(
@@ -353,10 +669,12 @@ def run_traffic_scenario(net, duration_limit=None):
                             name, bw, dur
                         )
                     )
-                    start_iperf_flow(host, bw, dur, "_sub")
+                    flows.append(_start_flow(entry, bw, dur, "_sub"))
 
                 if max_dur_sub > 0:
-                    time.sleep(max_dur_sub + 1.0)
+                    wait_for_flows(
+                        done_fds, flows, scenario_start + max_dur_sub + 1.0
+                    )
 
             print("   -> Suburb scenario complete.")
             update_status("C-Suburb-done", [])
@@ -366,8 +684,6 @@ def run_traffic_scenario(net, duration_limit=None):
         print(">>> [Traffic Gen] Error: {}".format(e))
         traceback.print_exc()
     finally:
-        with status_lock:
-            traffic_status["running"] = False
-            traffic_status["current_scenario"] = "stopped"
-            traffic_status["active_nodes"] = []
+        stop_flow_agents(host_table, done_fds)
+        _set_status(running=False, current_scenario="stopped", active_nodes=[])
         print(">>> [Traffic Gen] Finished {} cycles.".format(cycle))
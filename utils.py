@@ -4,6 +4,18 @@
 
 import re
 
+# Pre-compiled patterns for tc / ping output
+_BACKLOG_RE = re.compile(r"backlog\s+\d+b\s+(\d+)p")
+_DROPPED_RE = re.compile(r"dropped\s+(\d+)")
+_QDISC_SPLIT_RE = re.compile(r"^(?=qdisc )", re.MULTILINE)
+_DEV_RE = re.compile(r"\bdev\s+(\S+)")
+_RTT_RE = re.compile(r"time=([\d\.]+)\s*ms")
+
+# Counters come from /proc/net/dev, which always shows the reading process's
+# network namespace. /sys/class/net shows the namespace sysfs was mounted
+# in, and Mininet hosts do not remount it.
+_NET_DEV_CMD = "cat /proc/net/dev 2>/dev/null"
+
 
 def get_interface_stats(node, intf):
     """
@@ -14,26 +26,33 @@ def get_interface_stats(node, intf):
         intf: Interface name string, e.g., "h1-eth0".
 
     Returns:
-        (tx_bytes, rx_bytes, tx_dropped) as integers.
+        (tx_bytes, rx_bytes, tx_dropped) as integers; zeros if the
+        interface is not found.
     """
-    cmd = (
-        "cat /sys/class/net/{intf}/statistics/tx_bytes "
-        "/sys/class/net/{intf}/statistics/rx_bytes "
-        "/sys/class/net/{intf}/statistics/tx_dropped 2>/dev/null"
-    ).format(intf=intf)
+    return _parse_net_dev(node.cmd(_NET_DEV_CMD)).get(intf, (0, 0, 0))
 
-    out = node.cmd(cmd).strip().split()
-    if len(out) != 3:
-        return 0, 0, 0
 
-    try:
-        tx = int(out[0])
-        rx = int(out[1])
-        dropped = int(out[2])
-    except ValueError:
-        return 0, 0, 0
+def _parse_net_dev(out):
+    """Parse /proc/net/dev into {intf: (tx_bytes, rx_bytes, tx_dropped)}."""
+    stats = {}
+    for line in out.splitlines():
+        # Header lines have no ':'; the counter field may follow it directly
+        name, sep, counters = line.partition(":")
+        if not sep:
+            continue
+
+        fields = counters.split()
+        if len(fields) < 16:
+            continue
+
+        try:
+            # Receive: bytes packets errs drop fifo frame compressed multicast
+            # Transmit: bytes packets errs drop fifo colls carrier compressed
+            stats[name.strip()] = (int(fields[8]), int(fields[0]), int(fields[11]))
+        except ValueError:
+            continue
 
-    return tx, rx, dropped
+    return stats
 
 
 def get_queue_stats(node, intf):
@@ -47,10 +66,18 @@ def get_queue_stats(node, intf):
     Returns:
         (queue_depth_packets, dropped_packets) as integers.
     """
-    out = node.cmd("tc -s qdisc show dev {} 2>/dev/null".format(intf))
+    return _parse_queue_stats(node.cmd(_queue_stats_cmd(intf)))
 
-    q_match = re.search(r"backlog\s+\d+b\s+(\d+)p", out)
-    d_match = re.search(r"dropped\s+(\d+)", out)
+
+def _queue_stats_cmd(intf):
+    """Shell command printing tc qdisc statistics of intf."""
+    return "tc -s qdisc show dev {} 2>/dev/null".format(intf)
+
+
+def _parse_queue_stats(out):
+    """Parse _queue_stats_cmd() output into (queue_depth, drops)."""
+    q_match = _BACKLOG_RE.search(out)
+    d_match = _DROPPED_RE.search(out)
 
     q_depth = int(q_match.group(1)) if q_match else 0
     drops = int(d_match.group(1)) if d_match else 0
@@ -58,6 +85,39 @@ def get_queue_stats(node, intf):
     return q_depth, drops
 
 
+def get_all_queue_stats(node):
+    """
+    Read queue depth and dropped packets for every interface in the node's
+    namespace with a single tc call.
+
+    For each interface only the first (root) qdisc is used, matching
+    get_queue_stats().
+
+    Args:
+        node: Mininet host or switch object.
+
+    Returns:
+        dict: intf -> (queue_depth_packets, dropped_packets).
+    """
+    out = node.cmd("tc -s qdisc show 2>/dev/null")
+
+    stats = {}
+    for block in _QDISC_SPLIT_RE.split(out):
+        dev_match = _DEV_RE.search(block)
+        if not dev_match or dev_match.group(1) in stats:
+            continue
+
+        q_match = _BACKLOG_RE.search(block)
+        d_match = _DROPPED_RE.search(block)
+
+        stats[dev_match.group(1)] = (
+            int(q_match.group(1)) if q_match else 0,
+            int(d_match.group(1)) if d_match else 0,
+        )
+
+    return stats
+
+
 def parse_ping_rtt(ping_output):
     """
     Parse RTT from ping output.
@@ -70,7 +130,7 @@ def parse_ping_rtt(ping_output):
     """
     try:
         # 典型格式: "time=12.345 ms"
-        match = re.search(r"time=([\d\.]+)\s*ms", ping_output)
+        match = _RTT_RE.search(ping_output)
         if match:
             return float(match.group(1))
     except Exception:
@@ -93,6 +153,11 @@ def ping_once(node, target_ip, timeout_sec=0.2):
           - rtt_ms   : float (RTT in ms) or None if timeout/failure
           - loss_flag: 0 if reply received, 1 if timeout/failure
     """
+    return _parse_ping_result(node.cmd(_ping_cmd(target_ip, timeout_sec)))
+
+
+def _ping_cmd(target_ip, timeout_sec):
+    """Shell command sending one timeout-bounded ping to target_ip."""
     # Sanitize timeout value
     try:
         t = float(timeout_sec)
@@ -105,11 +170,13 @@ def ping_once(node, target_ip, timeout_sec=0.2):
     # 用 'timeout' 控制整体执行时间
     # -c 1: 发送 1 个包
     # -W 1: ping 自身等待 1 秒；实际由 timeout t 提前杀掉
-    cmd = "timeout {t:.3f} ping -c 1 -W 1 {ip} 2>/dev/null".format(
+    return "timeout {t:.3f} ping -c 1 -W 1 {ip} 2>/dev/null".format(
         t=t, ip=target_ip
     )
 
-    out = node.cmd(cmd)
+
+def _parse_ping_result(out):
+    """Parse _ping_cmd() output into (rtt_ms, loss_flag); see ping_once."""
     rtt = parse_ping_rtt(out)
 
     if rtt is None:
@@ -119,6 +186,55 @@ def ping_once(node, target_ip, timeout_sec=0.2):
         return rtt, 0
 
 
+# Marks section boundaries in get_host_telemetry()'s combined output
+_SECTION_SEP = "__v2x_section__"
+
+
+def get_host_telemetry(node, intf, target_ip, timeout_sec=0.2):
+    """
+    Read interface counters, queue stats and one ping RTT for a host in a
+    single round trip through the node's shell.
+
+    Mininet keeps one long-lived shell per node, so the three reads are sent
+    as one compound command instead of three node.cmd() calls. The ping
+    runs last so the counters are sampled as close to the call as possible.
+
+    Args:
+        node: Mininet host object.
+        intf: Interface name string, e.g., "h1-eth0".
+        target_ip: Destination IP string for the ping.
+        timeout_sec: Ping timeout in seconds (see ping_once).
+
+    Returns:
+        dict with keys tx_bytes, rx_bytes, tx_dropped, queue_depth,
+        queue_drops, rtt_ms (None on timeout) and rtt_loss (0/1).
+    """
+    sep = "; echo {}; ".format(_SECTION_SEP)
+    cmd = sep.join([
+        _NET_DEV_CMD,
+        _queue_stats_cmd(intf),
+        _ping_cmd(target_ip, timeout_sec),
+    ])
+
+    sections = node.cmd(cmd).split(_SECTION_SEP)
+    if len(sections) != 3:
+        sections = ["", "", ""]
+
+    tx, rx, dropped = _parse_net_dev(sections[0]).get(intf, (0, 0, 0))
+    q_depth, q_drops = _parse_queue_stats(sections[1])
+    rtt_ms, rtt_loss = _parse_ping_result(sections[2])
+
+    return {
+        "tx_bytes": tx,
+        "rx_bytes": rx,
+        "tx_dropped": dropped,
+        "queue_depth": q_depth,
+        "queue_drops": q_drops,
+        "rtt_ms": rtt_ms,
+        "rtt_loss": rtt_loss,
+    }
+
+
 def start_iperf_servers(mec_node, n_hosts, base_port=5000):
     """
     Start one iperf3 server per host on the MEC node.
@@ -134,7 +250,9 @@ def start_iperf_servers(mec_node, n_hosts, base_port=5000):
     # Kill any previous iperf3 servers on the MEC
     mec_node.cmd("pkill -9 iperf3 2>/dev/null")
 
-    for i in range(1, n_hosts + 1):
-        port = base_port + i
-        cmd = "iperf3 -s -p {} -D".format(port)
-        mec_node.cmd(cmd)
+    # -D daemonizes each server, so all of them can be started from a single
+    # shell command instead of one node.cmd() round trip per port
+    cmd = "; ".join(
+        "iperf3 -s -p {} -D".format(base_port + i) for i in range(1, n_hosts + 1)
+    )
+    mec_node.cmd(cmd)
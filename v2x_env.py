@@ -32,6 +32,21 @@ class HybridV2XTopo(Topo):
       - 14 RSU hosts: h1-h4 (highway), h5-h10 (urban), h11-h14 (suburban)
     """
 
+    # (RSU host indices, zone switch, access bandwidth in Mbps)
+    _ACCESS_TIERS = (
+        (range(1, 5), "s_hw", BW_ACCESS_HW),      # Highway RSUs: h1-h4
+        (range(5, 11), "s_urb", BW_ACCESS_URB),   # Urban RSUs: h5-h10
+        (range(11, 15), "s_sub", BW_ACCESS_SUB),  # Suburban RSUs: h11-h14
+    )
+
+    # Link options shared by every access link; only bw differs per tier
+    _ACCESS_LINK_OPTS = dict(
+        cls=TCLink,
+        delay=ACCESS_DELAY,
+        max_queue_size=QUEUE_ACCESS,
+        use_htb=True,
+    )
+
     def build(self):
         # Switches with explicit dpids because names are non-canonical
         s_core = self.addSwitch("s_core", dpid="0000000000000001")
@@ -65,17 +80,10 @@ class HybridV2XTopo(Topo):
                 use_htb=True,
             )
 
-        # Highway RSUs: h1-h4
-        for i in range(1, 5):
-            self._add_rsu(i, s_hw, BW_ACCESS_HW)
-
-        # Urban RSUs: h5-h10
-        for i in range(5, 11):
-            self._add_rsu(i, s_urb, BW_ACCESS_URB)
-
-        # Suburban RSUs: h11-h14
-        for i in range(11, 15):
-            self._add_rsu(i, s_sub, BW_ACCESS_SUB)
+        # RSUs, one access tier per zone switch
+        for indices, sw_name, bw_mbps in self._ACCESS_TIERS:
+            for i in indices:
+                self._add_rsu(i, sw_name, bw_mbps)
 
     def _add_rsu(self, index, switch, bw_mbps):
         """
@@ -90,15 +98,7 @@ class HybridV2XTopo(Topo):
         ip = "10.0.0.{}".format(index)
 
         host = self.addHost(name, ip=ip)
-        self.addLink(
-            host,
-            switch,
-            cls=TCLink,
-            bw=bw_mbps,
-            delay=ACCESS_DELAY,
-            max_queue_size=QUEUE_ACCESS,
-            use_htb=True,
-        )
+        self.addLink(host, switch, bw=bw_mbps, **self._ACCESS_LINK_OPTS)
 
 
 # Allow Mininet CLI to find this topology using '--topo v2x'